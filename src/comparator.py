@@ -1,34 +1,45 @@
 from __future__ import annotations
 
-from sklearn.feature_extraction.text import CountVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from collections import Counter
+import math
+import re
 
 from src.preprocessor import DataPreprocessor
 
 
+# Same tokenization as the CountVectorizer defaults.
+_TERM_RE = re.compile(r"(?u)\b\w\w+\b")
+
+
 class DataComparator:
     def __init__(self, resume_path: str, vacancy_path: str, lang: str = "ru") -> None:
         self.preprocessor = DataPreprocessor()
-        self.vectorizer = CountVectorizer()
         self.resume_data = self.preprocessor._load_data_from_file(resume_path)
         self.vacancy_data = self.preprocessor._load_data_from_file(vacancy_path)
         self.lang = lang
+        self.resume_terms = Counter(_TERM_RE.findall(self.resume_data.lower()))
+        self.vacancy_terms = Counter(_TERM_RE.findall(self.vacancy_data.lower()))
 
     def matchKeywords(self):
-        # keywords_resume = self.preprocessor.spacy_keywords(self.resume_data, lang=self.lang)
-        # keywords_vacancy = self.preprocessor.spacy_keywords(self.vacancy_data, lang=self.lang)
-        keywords_resume = self.preprocessor.nltk_keywords(self.resume_data, lang=self.lang)
-        keywords_vacancy = self.preprocessor.nltk_keywords(self.vacancy_data, lang=self.lang)
-        vacancy_keywords_in_resume_list = [w for w in keywords_vacancy if w in keywords_resume]
-        vacancy_keywords_in_resume_count = len(vacancy_keywords_in_resume_list)
+        # keywords_resume, keywords_vacancy = self.preprocessor.spacy_keywords_batch(
+        #     [self.resume_data, self.vacancy_data], lang=self.lang
+        # )
+        keywords_resume, keywords_vacancy = self.preprocessor.nltk_keywords_batch(
+            [self.resume_data, self.vacancy_data], lang=self.lang
+        )
+        vacancy_keywords_in_resume_count = len(keywords_vacancy & keywords_resume)
         vacancy_keywords_count = len(keywords_vacancy)
         matchPercentage = (vacancy_keywords_in_resume_count / vacancy_keywords_count) * 100
         matchPercentage = round(matchPercentage, 2)
         return matchPercentage
 
     def matchSimilarity(self):
-        data = [self.resume_data, self.vacancy_data]
-        count_matrix = self.vectorizer.fit_transform(data)
-        matchPercentage = cosine_similarity(count_matrix)[0][1] * 100
+        shared_terms = self.resume_terms.keys() & self.vacancy_terms.keys()
+        dot = sum(self.resume_terms[t] * self.vacancy_terms[t] for t in shared_terms)
+        if not dot:
+            return 0.0
+        resume_norm = math.sqrt(sum(v * v for v in self.resume_terms.values()))
+        vacancy_norm = math.sqrt(sum(v * v for v in self.vacancy_terms.values()))
+        matchPercentage = dot / (resume_norm * vacancy_norm) * 100
         matchPercentage = round(matchPercentage, 2)
         return matchPercentage
\ No newline at end of file
@@ -1,12 +1,80 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+import os
 import nltk
-from nltk import pos_tag
-from nltk import word_tokenize
+from nltk.tag import PerceptronTagger
 from nltk.corpus import stopwords
+import docx
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
+import pypdfium2
 import textract
 import spacy
 import re
+import threading
+
+
+_STOP_WORDS = {
+    "ru": frozenset(stopwords.words("russian")),
+    "en": frozenset(stopwords.words("english")),
+}
+_CLEAN_RE = {
+    "ru": re.compile(r"[^а-яА-Я0-9\s\/]"),
+    "en": re.compile(r"[^a-zA-Z0-9\s\/]"),
+}
+_TOKEN_RE = re.compile(r"\w+")
+_NLTK_KEYWORD_TAGS = frozenset({"NNP", "NN", "VBP", "JJ"})
+_SPACY_KEYWORD_TAGS = frozenset({"NNP"})
+_SPACY_MODELS = {
+    "ru": "ru_core_news_sm",
+    "en": "en_core_web_sm",
+}
+_DOCX_PARAGRAPH_TAG = qn("w:p")
+_DOCX_TEXT_TAG = qn("w:t")
+_DOCX_WHITESPACE_TAGS = {
+    qn("w:tab"): "\t",
+    qn("w:br"): "\n",
+    qn("w:cr"): "\n",
+}
+_DOCX_FALLBACK_TAG = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+
+_NLTK_TAGGER = Future()
+
+
+def _load_nltk_tagger() -> None:
+    """Load the NLTK parts of speech tagger into _NLTK_TAGGER.
+
+    Runs in a background thread started at import, so the tagger model is loaded while input files are read.
+    Any failure is stored in the future, so waiting callers never block forever.
+    """
+    try:
+        _NLTK_TAGGER.set_result(PerceptronTagger())
+    except BaseException as e:
+        _NLTK_TAGGER.set_exception(e)
+
+
+threading.Thread(target=_load_nltk_tagger, daemon=True).start()
+
+
+@lru_cache(maxsize=2)
+def _get_nlp(lang: str = "ru"):
+    """Load the spacy language module once per language.
+
+    Only the tagger is kept, the other pipeline components are not used for keyword detection.
+
+    Args:
+        lang (str): Text language ["ru", "en"].
+
+    Returns:
+        nlp: Spacy language module.
+    """
+    nlp = spacy.load(_SPACY_MODELS[lang], exclude=["parser", "ner", "lemmatizer", "attribute_ruler"])
+    return nlp
 
 
 class DataPreprocessor:
@@ -14,13 +82,17 @@ class DataPreprocessor:
     def _load_data_from_file(filepath: str) -> str:
         """Read different types of source files.
 
+        The result is cached per resolved file path and is reread once the file modification time or size changes.
+
         Args:
             filepath (str): Multiple file types like DOCX, PDF, TXT.
 
         Returns:
             data (str): Text string.
         """
-        data = str(textract.process(filepath), encoding="UTF-8")
+        filepath = os.path.realpath(filepath)
+        stat = os.stat(filepath)
+        data = _read_data_from_file(filepath, stat.st_mtime_ns, stat.st_size)
         return data
 
     @staticmethod
@@ -34,48 +106,13 @@ class DataPreprocessor:
         Returns:
             text (str): Text string.
         """
-        if lang == "ru":
-            text = re.sub(r"[^а-яА-Я0-9\s\/]", "", text)
-        if lang == "en":
-            text = re.sub(r"[^a-zA-Z0-9\s\/]", "", text)
+        text = _CLEAN_RE[lang].sub("", text)
         text = text.replace("/", " ")
         return text
 
-    @staticmethod
-    def _filter_token_tag(tagged_token_list: list, filter_tag_list: list) -> list:
-        """Filter the tagged token list present in the filter tag list.
-
-        Args:
-            tagged_token_list (list): Tagged token list.
-            filter_tag_list (list): Filter tag list.
-
-        Returns:
-            filtered_token_list (list): List containing tokens corresponding to tags present in the filter tag list.
-        """
-        filtered_token_list = [t[0] for t in tagged_token_list if t[1] in filter_tag_list]
-        filtered_token_list = [str(item) for item in filtered_token_list]
-        return filtered_token_list
-
-    @staticmethod
-    def _unique_tokens(token_list: list) -> list:
-        """Remove duplicate tokens from the input token list.
-
-        Args:
-            token_list (list): Token list.
-
-        Returns:
-            unique_token_list (list): Unique token list.
-        """
-        unique_token_list = []
-        for x in token_list:
-            x = x.lower()
-            if x not in unique_token_list:
-                unique_token_list.append(x)
-        return unique_token_list
-
     @staticmethod
     def _nltk_tokenizer(text: str) -> list:
-        """Use the NLTK tokeniser to tokenise the input text.
+        """Tokenise the input text into word tokens for the NLTK pipeline.
 
         Args:
             text (str): Text string.
@@ -83,42 +120,24 @@ class DataPreprocessor:
         Returns:
             tokens (list): Tokens.
         """
-        tokens = word_tokenize(text)
+        tokens = _TOKEN_RE.findall(text)
         return tokens
 
     @staticmethod
-    def _nltk_pos_tag(token_list: list) -> list:
-        """Use the NLTK parts of speech tagger to apply tags to the input token list.
+    def _nltk_pos_tag_sents(token_lists: list) -> list:
+        """Use the NLTK parts of speech tagger to apply tags to several token lists in a single call.
 
         Args:
-            token_list (list): Token List.
+            token_lists (list): Token lists.
 
         Returns:
-            tagged_list (list): Tagged token list.
+            tagged_lists (list): Tagged token lists.
         """
-        tagged_list = pos_tag(token_list)
-        return tagged_list
+        tagged_lists = _NLTK_TAGGER.result().tag_sents(token_lists)
+        return tagged_lists
 
     @staticmethod
-    def _nltk_stopwords_removal(token_list: list, lang: str = "ru") -> list:
-        """Use the NLTK parts of speech tagger to apply tags to the input token list.
-
-        Args:
-            token_list (list): Token List.
-            lang (str): Text language ["ru", "en"].
-
-        Returns:
-            stopwords_filtered_list (list): Stopwords filtered list.
-        """
-        if lang == "ru":
-            stop_words = set(stopwords.words("russian"))
-        if lang == "en":
-            stop_words = set(stopwords.words("english"))
-        stopwords_filtered_list = [w for w in token_list if w not in stop_words]
-        return stopwords_filtered_list
-
-    @classmethod
-    def nltk_keywords(self, data: str, lang: str = "ru") -> list:
+    def nltk_keywords(data: str, lang: str = "ru") -> frozenset:
         """Use the NLTK pipeline to detect keywords from input text data.
 
         Args:
@@ -126,79 +145,190 @@ class DataPreprocessor:
             lang (str): Text language ["ru", "en"].
 
         Returns:
-            keywords (list): Keywords.
+            keywords (frozenset): Keywords.
         """
-        data = self._clean_text(data, lang=lang)
-        tokens = self._nltk_tokenizer(data)
-        pos_tagged_tokens = self._nltk_pos_tag(tokens)
-        keywords = self._filter_token_tag(pos_tagged_tokens, filter_tag_list=["NNP", "NN", "VBP", "JJ"])
-        keywords = self._nltk_stopwords_removal(keywords, lang=lang)
-        keywords = self._unique_tokens(keywords)
+        keywords = _nltk_keywords_batch([data], lang=lang)[0]
         return keywords
 
     @staticmethod
-    def _spacy_tokenizer(text: str, nlp) -> list:
-        """Use the spacy tokeniser to tokenise the input text.
+    def nltk_keywords_batch(docs: list, lang: str = "ru") -> list:
+        """Use the NLTK pipeline to detect keywords from several input texts in a single batch.
 
         Args:
-            data (str): Text string.
-            nlp: Spacy language module.
+            docs (list): Text data list.
+            lang (str): Text language ["ru", "en"].
 
         Returns:
-            tokens (list): Tokens.
+            keywords_list (list): Keywords frozenset for each input text.
         """
-        tokens = nlp(text)
-        return tokens
+        keywords_list = _nltk_keywords_batch(docs, lang=lang)
+        return keywords_list
 
     @staticmethod
-    def _spacy_pos_tag(token_list: list) -> list:
-        """Use the spacy parts of speech tagger to apply tags to the input token list.
+    def spacy_keywords(data: str, lang: str = "ru") -> frozenset:
+        """Use the spacy pipeline to detect keywords from input text data.
 
         Args:
-            token_list (list): Token List.
+            data (str): Text data.
+            lang (str): Text language ["ru", "en"].
 
         Returns:
-            tagged_list (list): Tagged token list.
+            keywords (frozenset): Keywords.
         """
-        tagged_list = []
-        for tok in token_list:
-            tagged_list.append((tok,tok.tag_))
-        return tagged_list
+        keywords = DataPreprocessor.spacy_keywords_batch([data], lang=lang)[0]
+        return keywords
 
     @staticmethod
-    def _spacy_stopwords_removal(token_list: list, nlp) -> list:
-        """Remove stopwords from the input token list using the spacy stopwords dictionary.
-
-        Args:
-            token_list (list): Token List.
-            nlp: Spacy language module.
-
-        Returns:
-            stopwords_filtered_list (list): Stopwords filtered list.
-        """
-        stop_words = nlp.Defaults.stop_words
-        stopwords_filtered_list = [w for w in token_list if w not in stop_words] 
-        return stopwords_filtered_list
-
-    @classmethod
-    def spacy_keywords(self, data: str, lang: str = "ru") -> list:
-        """Use the spacy pipeline to detect keywords from input text data.
+    def spacy_keywords_batch(docs: list, lang: str = "ru") -> list:
+        """Use the spacy pipeline to detect keywords from several input texts in a single batch.
 
         Args:
-            data (str): Text data.
+            docs (list): Text data list.
             lang (str): Text language ["ru", "en"].
 
         Returns:
-            keywords (list): Keywords.
+            keywords_list (list): Keywords frozenset for each input text.
         """
-        if lang == "ru":
-            nlp = spacy.load("ru_core_news_sm")
-        if lang == "en":
-            nlp = spacy.load("en_core_web_sm")
-        data = self._clean_text(data, lang=lang)
-        tokens = self._spacy_tokenizer(data, nlp=nlp)
-        pos_tagged_tokens = self._spacy_pos_tag(tokens)
-        keywords = self._filter_token_tag(pos_tagged_tokens, filter_tag_list=["NNP"])
-        keywords = self._spacy_stopwords_removal(keywords, nlp=nlp)
-        keywords = self._unique_tokens(keywords)
-        return keywords
+        nlp = _get_nlp(lang)
+        stop_words = nlp.Defaults.stop_words
+        docs = [DataPreprocessor._clean_text(data, lang=lang) for data in docs]
+        keywords_list = []
+        for doc in nlp.pipe(docs, batch_size=len(docs) or 1, n_process=1):
+            keywords = frozenset(tok.text.lower() for tok in doc if tok.tag_ in _SPACY_KEYWORD_TAGS)
+            keywords_list.append(keywords - stop_words)
+        return keywords_list
+
+
+@lru_cache(maxsize=128)
+def _read_data_from_file(filepath: str, mtime_ns: int, size: int) -> str:
+    """Read different types of source files.
+
+    TXT, PDF and DOCX files are read in-process, other file types go through textract.
+    TXT files are decoded as UTF-8, falling back to cp1251.
+    The modification time and size only take part in the cache key.
+
+    Args:
+        filepath (str): Resolved path of multiple file types like DOCX, PDF, TXT.
+        mtime_ns (int): File modification time in nanoseconds.
+        size (int): File size in bytes.
+
+    Returns:
+        data (str): Text string.
+    """
+    extension = Path(filepath).suffix.lower()
+    if extension == ".txt":
+        data = _decode_text(Path(filepath).read_bytes())
+    elif extension == ".pdf":
+        pdf = pypdfium2.PdfDocument(filepath)
+        try:
+            data = "\n".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+    elif extension == ".docx":
+        data = _read_docx(filepath)
+    else:
+        data = str(textract.process(filepath), encoding="UTF-8")
+    return data
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode text file contents as UTF-8, falling back to cp1251.
+
+    The locale encoding is not tried, single-byte locales like cp1252 decode cp1251 Cyrillic into Latin garbage.
+
+    Args:
+        raw (bytes): File contents.
+
+    Returns:
+        data (str): Text string.
+    """
+    try:
+        data = raw.decode("UTF-8")
+    except UnicodeDecodeError:
+        data = raw.decode("cp1251")
+    return data
+
+
+def _read_docx(filepath: str) -> str:
+    """Read the header, body and footer text of a DOCX file in document order.
+
+    Args:
+        filepath (str): DOCX file path.
+
+    Returns:
+        data (str): Text string.
+    """
+    document = docx.Document(filepath)
+    rels = document.part.rels.values()
+    headers = [rel.target_part.element for rel in rels if rel.reltype == RT.HEADER]
+    footers = [rel.target_part.element for rel in rels if rel.reltype == RT.FOOTER]
+    texts = []
+    for element in headers + [document.element.body] + footers:
+        _collect_docx_text(element, texts)
+    data = "".join(texts)
+    return data
+
+
+def _collect_docx_text(element, texts: list) -> None:
+    """Collect the text of a WordprocessingML element in document order.
+
+    Every w:t is kept, including text boxes, nested tables and content controls, and paragraph ends,
+    tabs and breaks become whitespace. mc:Fallback is skipped, it repeats the text of the mc:Choice markup.
+
+    Args:
+        element: WordprocessingML element.
+        texts (list): Collected text pieces.
+    """
+    for child in element.iterchildren():
+        if child.tag == _DOCX_TEXT_TAG:
+            texts.append(child.text or "")
+        elif child.tag in _DOCX_WHITESPACE_TAGS:
+            texts.append(_DOCX_WHITESPACE_TAGS[child.tag])
+        elif child.tag != _DOCX_FALLBACK_TAG:
+            _collect_docx_text(child, texts)
+            if child.tag == _DOCX_PARAGRAPH_TAG:
+                texts.append("\n")
+
+
+
+_NLTK_KEYWORDS_CACHE_SIZE = 128
+_NLTK_KEYWORDS_CACHE = OrderedDict()
+_NLTK_KEYWORDS_LOCK = threading.Lock()
+
+
+def _nltk_keywords_batch(docs: list, lang: str = "ru") -> list:
+    """Use the NLTK pipeline to detect keywords from several input texts, tagging them in a single call.
+
+    Keywords are cached per text in a bounded LRU cache, only the texts missing from the cache are tagged.
+
+    Args:
+        docs (list): Text data list.
+        lang (str): Text language ["ru", "en"].
+
+    Returns:
+        keywords_list (list): Keywords frozenset for each input text.
+    """
+    keys = [(data, lang) for data in docs]
+    keywords_by_key = {}
+    with _NLTK_KEYWORDS_LOCK:
+        for key in keys:
+            if key in _NLTK_KEYWORDS_CACHE:
+                _NLTK_KEYWORDS_CACHE.move_to_end(key)
+                keywords_by_key[key] = _NLTK_KEYWORDS_CACHE[key]
+    missing = [key for key in dict.fromkeys(keys) if key not in keywords_by_key]
+    if missing:
+        stop_words = _STOP_WORDS[lang]
+        token_lists = [
+            DataPreprocessor._nltk_tokenizer(DataPreprocessor._clean_text(data, lang=lang)) for data, _ in missing
+        ]
+        for key, pos_tagged_tokens in zip(missing, DataPreprocessor._nltk_pos_tag_sents(token_lists)):
+            keywords = frozenset(tok.lower() for tok, tag in pos_tagged_tokens if tag in _NLTK_KEYWORD_TAGS)
+            keywords_by_key[key] = keywords - stop_words
+        with _NLTK_KEYWORDS_LOCK:
+            for key in missing:
+                _NLTK_KEYWORDS_CACHE[key] = keywords_by_key[key]
+                _NLTK_KEYWORDS_CACHE.move_to_end(key)
+            while len(_NLTK_KEYWORDS_CACHE) > _NLTK_KEYWORDS_CACHE_SIZE:
+                _NLTK_KEYWORDS_CACHE.popitem(last=False)
+    keywords_list = [keywords_by_key[key] for key in keys]
+    return keywords_list
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pytest
+
+from src import preprocessor
+from src.preprocessor import DataPreprocessor
+
+
+@pytest.fixture
+def tagged_batches(monkeypatch) -> list:
+    """Replace the NLTK tagger with one tagging every token "NN" and record the token lists of each call."""
+    batches = []
+
+    def pos_tag_sents(token_lists: list) -> list:
+        batches.append(token_lists)
+        return [[(tok, "NN") for tok in tokens] for tokens in token_lists]
+
+    monkeypatch.setattr(DataPreprocessor, "_nltk_pos_tag_sents", staticmethod(pos_tag_sents))
+    monkeypatch.setattr(preprocessor, "_NLTK_KEYWORDS_CACHE", OrderedDict())
+    return batches
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from src.comparator import DataComparator
+
+
+RESUME = "Python developer, Python and SQL."
+VACANCY = "Senior Python developer with SQL."
+
+
+@pytest.fixture
+def comparator(tmp_path) -> DataComparator:
+    resume_path = tmp_path / "resume.txt"
+    vacancy_path = tmp_path / "vacancy.txt"
+    resume_path.write_text(RESUME, encoding="UTF-8")
+    vacancy_path.write_text(VACANCY, encoding="UTF-8")
+    return DataComparator(str(resume_path), str(vacancy_path), lang="en")
+
+
+def test_match_similarity_fixed_pair(comparator: DataComparator) -> None:
+    # Term counts: resume python=2, developer, and, sql; vacancy senior, python, developer, with, sql.
+    # Cosine = 4 / sqrt(7 * 5).
+    assert comparator.matchSimilarity() == 67.61
+
+
+def test_match_similarity_matches_count_vectorizer(comparator: DataComparator) -> None:
+    text = pytest.importorskip("sklearn.feature_extraction.text")
+    pairwise = pytest.importorskip("sklearn.metrics.pairwise")
+    count_matrix = text.CountVectorizer().fit_transform([RESUME, VACANCY])
+    expected = round(pairwise.cosine_similarity(count_matrix)[0][1] * 100, 2)
+    assert comparator.matchSimilarity() == expected
+
+
+def test_match_similarity_no_shared_terms(tmp_path) -> None:
+    resume_path = tmp_path / "resume.txt"
+    vacancy_path = tmp_path / "vacancy.txt"
+    resume_path.write_text("Python developer", encoding="UTF-8")
+    vacancy_path.write_text("Accountant", encoding="UTF-8")
+    assert DataComparator(str(resume_path), str(vacancy_path), lang="en").matchSimilarity() == 0.0
+
+
+def test_match_keywords_counts_vacancy_keywords_found_in_resume(tmp_path, tagged_batches: list) -> None:
+    resume_path = tmp_path / "resume.txt"
+    vacancy_path = tmp_path / "vacancy.txt"
+    resume_path.write_text("Python developer and SQL", encoding="UTF-8")
+    vacancy_path.write_text("Senior Python developer with Docker", encoding="UTF-8")
+    comparator = DataComparator(str(resume_path), str(vacancy_path), lang="en")
+    # Vacancy keywords: senior, python, developer, docker; two of them are in the resume.
+    assert comparator.matchKeywords() == 50.0
+    assert len(tagged_batches) == 1
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import os
+import zipfile
+
+from src.preprocessor import DataPreprocessor
+
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+WPS_NS = "http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+V_NS = "urn:schemas-microsoft-com:vml"
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml"
+    ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+  <Override PartName="/word/header1.xml"
+    ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>
+</Types>"""
+
+PACKAGE_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Target="word/document.xml"
+    Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>
+</Relationships>"""
+
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Target="header1.xml"
+    Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header"/>
+</Relationships>"""
+
+HEADER = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:hdr xmlns:w="{W_NS}"><w:p><w:r><w:t>Header contacts</w:t></w:r></w:p></w:hdr>"""
+
+DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}" xmlns:mc="{MC_NS}" xmlns:wps="{WPS_NS}" xmlns:v="{V_NS}">
+  <w:body>
+    <w:p><w:r><w:t>Summary</w:t></w:r></w:p>
+    <w:tbl>
+      <w:tr>
+        <w:tc><w:p><w:r><w:t>Skills</w:t></w:r></w:p></w:tc>
+        <w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p></w:tc>
+      </w:tr>
+      <w:tr>
+        <w:tc>
+          <w:tcPr><w:gridSpan w:val="2"/></w:tcPr>
+          <w:p><w:r><w:t>Merged experience</w:t></w:r></w:p>
+          <w:tbl><w:tr><w:tc><w:p><w:r><w:t>Nested cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+        </w:tc>
+      </w:tr>
+    </w:tbl>
+    <w:p>
+      <w:r>
+        <mc:AlternateContent>
+          <mc:Choice Requires="wps">
+            <w:drawing><wps:txbx><w:txbxContent>
+              <w:p><w:r><w:t>Text box skill</w:t></w:r></w:p>
+            </w:txbxContent></wps:txbx></w:drawing>
+          </mc:Choice>
+          <mc:Fallback>
+            <w:pict><v:shape><v:textbox><w:txbxContent>
+              <w:p><w:r><w:t>Text box skill</w:t></w:r></w:p>
+            </w:txbxContent></v:textbox></v:shape></w:pict>
+          </mc:Fallback>
+        </mc:AlternateContent>
+      </w:r>
+    </w:p>
+    <w:sdt><w:sdtContent><w:p><w:r><w:t>Content control</w:t></w:r></w:p></w:sdtContent></w:sdt>
+    <w:p><w:r><w:t>Closing</w:t></w:r></w:p>
+    <w:sectPr><w:headerReference w:type="default" r:id="rId1"/></w:sectPr>
+  </w:body>
+</w:document>"""
+
+
+def write_docx(path) -> None:
+    with zipfile.ZipFile(path, "w") as package:
+        package.writestr("[Content_Types].xml", CONTENT_TYPES)
+        package.writestr("_rels/.rels", PACKAGE_RELS)
+        package.writestr("word/document.xml", DOCUMENT)
+        package.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS)
+        package.writestr("word/header1.xml", HEADER)
+
+
+def test_load_docx_keeps_tables_and_text_boxes_in_document_order(tmp_path) -> None:
+    path = tmp_path / "resume.docx"
+    write_docx(path)
+    data = DataPreprocessor._load_data_from_file(str(path))
+    expected_order = [
+        "Header contacts",
+        "Summary",
+        "Skills",
+        "Python",
+        "Merged experience",
+        "Nested cell",
+        "Text box skill",
+        "Content control",
+        "Closing",
+    ]
+    assert [data.count(text) for text in expected_order] == [1] * len(expected_order)
+    positions = [data.index(text) for text in expected_order]
+    assert positions == sorted(positions)
+
+
+def test_load_txt_falls_back_to_cp1251(tmp_path) -> None:
+    path = tmp_path / "resume.txt"
+    path.write_bytes("Опыт работы: Python разработчик".encode("cp1251"))
+    data = DataPreprocessor._load_data_from_file(str(path))
+    assert data == "Опыт работы: Python разработчик"
+    assert DataPreprocessor._clean_text(data, lang="ru").split() == ["Опыт", "работы", "разработчик"]
+
+
+def test_nltk_keywords_cached_text_is_not_retagged(tagged_batches: list) -> None:
+    first = DataPreprocessor.nltk_keywords("Python developer", lang="en")
+    second = DataPreprocessor.nltk_keywords("Python developer", lang="en")
+    assert first == second == frozenset({"python", "developer"})
+    assert tagged_batches == [[["Python", "developer"]]]
+
+
+def test_nltk_keywords_batch_tags_misses_once_in_input_order(tagged_batches: list) -> None:
+    DataPreprocessor.nltk_keywords("Python developer", lang="en")
+    keywords_list = DataPreprocessor.nltk_keywords_batch(
+        ["Docker engineer", "Python developer", "SQL analyst", "Docker engineer"], lang="en"
+    )
+    assert keywords_list == [
+        frozenset({"docker", "engineer"}),
+        frozenset({"python", "developer"}),
+        frozenset({"sql", "analyst"}),
+        frozenset({"docker", "engineer"}),
+    ]
+    assert tagged_batches[1:] == [[["Docker", "engineer"], ["SQL", "analyst"]]]
+
+
+def test_load_data_from_file_rereads_changed_file(tmp_path) -> None:
+    path = tmp_path / "vacancy.txt"
+    path.write_text("Python developer", encoding="UTF-8")
+    assert DataPreprocessor._load_data_from_file(str(path)) == "Python developer"
+    path.write_text("Senior SQL analyst", encoding="UTF-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert DataPreprocessor._load_data_from_file(str(path)) == "Senior SQL analyst"
+
+
+def test_load_data_from_file_resolves_relative_paths(tmp_path, monkeypatch) -> None:
+    for name, text in (("first", "Python developer"), ("second", "Golang engineers")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "resume.txt").write_text(text, encoding="UTF-8")
+    stat = (tmp_path / "first" / "resume.txt").stat()
+    os.utime(tmp_path / "second" / "resume.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    monkeypatch.chdir(tmp_path / "first")
+    assert DataPreprocessor._load_data_from_file("resume.txt") == "Python developer"
+    monkeypatch.chdir(tmp_path / "second")
+    assert DataPreprocessor._load_data_from_file("resume.txt") == "Golang engineers"
+
+
+def test_nltk_keywords_returns_lowercased_frozenset_without_stopwords(tagged_batches: list) -> None:
+    keywords = DataPreprocessor.nltk_keywords("Python and SQL, Python", lang="en")
+    assert isinstance(keywords, frozenset)
+    assert keywords == frozenset({"python", "sql"})
+
+
+def write_pdf(path, text: str) -> None:
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(pdf)
+
+
+def test_load_pdf_extracts_page_text(tmp_path) -> None:
+    path = tmp_path / "resume.pdf"
+    write_pdf(path, "Python developer")
+    data = DataPreprocessor._load_data_from_file(str(path))
+    assert data.split() == ["Python", "developer"]